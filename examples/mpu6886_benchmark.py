@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: Copyright (c) 2023 Taiki Komoda for JINS Inc.
+#
+# SPDX-License-Identifier: Unlicense
+"""
+Measure the achievable sample rate of the MPU6886
+"""
+
+import time
+
+import board
+from adafruit_register.i2c_bits import RWBits
+from adafruit_register.i2c_struct import ROUnaryStruct, Struct
+from busio import I2C
+
+import mpu6886
+
+SAMPLES = 1000
+
+i2c = I2C(board.IMU_SCL, board.IMU_SDA, frequency=400_000)
+mpu = mpu6886.MPU6886(i2c)
+
+
+class LegacyReads:
+    """The register reads the driver used to make for every sample: separate accel, temperature
+    and gyro reads, plus a range register read each for acceleration and gyro"""
+
+    accel = Struct(0x3B, ">hhh")
+    temperature = ROUnaryStruct(0x41, ">h")
+    gyro = Struct(0x43, ">hhh")
+    accel_range = RWBits(2, 0x1C, 3)
+    gyro_range = RWBits(2, 0x1B, 3)
+
+    def __init__(self, i2c_device):
+        self.i2c_device = i2c_device
+
+
+legacy = LegacyReads(mpu.i2c_device)
+
+
+def benchmark(name, read):
+    t0 = time.monotonic()
+    for _ in range(SAMPLES):
+        read()
+    print(f"{name}: {SAMPLES / (time.monotonic() - t0):.1f} Hz")
+
+
+def read_legacy():
+    _ = legacy.accel
+    _ = legacy.accel_range
+    _ = legacy.gyro
+    _ = legacy.gyro_range
+    _ = legacy.temperature
+
+
+benchmark("sample_all()", mpu.sample_all)
+benchmark("old per-property register reads", read_legacy)
@@ -6,6 +6,7 @@
 Sample script for MPU6886
 """
 
+import sys
 import time
 
 import board
@@ -13,19 +14,23 @@ from busio import I2C
 
 import mpu6886
 
-i2c = I2C(board.IMU_SCL, board.IMU_SDA)
+i2c = I2C(board.IMU_SCL, board.IMU_SDA, frequency=400_000)  # the MPU6886 supports fast-mode
 mpu = mpu6886.MPU6886(i2c)
 
 mpu.gyro_range = 1
-time.sleep(0.05)
 mpu.accelerometer_range = 1
-time.sleep(0.05)
 
+# bind the format method once and write each sample with a single call
+FMT = (
+    "Acceleration: X:{:.2f}, Y:{:.2f}, Z:{:.2f} m/s^2\n"
+    "Gyro X:{:.2f}, Y:{:.2f}, Z:{:.2f} rad/s\n"
+    "Temperature: {:.2f} C\n\n"
+).format
+
+period = 1.0  # seconds between samples
+next_t = time.monotonic()
 while True:
-    ac = mpu.acceleration
-    gy = mpu.gyro
-    print(f"Acceleration: X:{ac[0]:.2f}, Y:{ac[1]:.2f}, Z:{ac[2]:.2f} m/s^2")
-    print(f"Gyro X:{gy[0]:.2f}, Y:{gy[1]:.2f}, Z:{gy[2]:.2f} rad/s")
-    print(f"Temperature: {mpu.temperature:.2f} C")
-    print("")
-    time.sleep(1)
+    ax, ay, az, gx, gy, gz, tc = mpu.sample_all()
+    sys.stdout.write(FMT(ax, ay, az, gx, gy, gz, tc))
+    next_t += period
+    time.sleep(max(0, next_t - time.monotonic()))
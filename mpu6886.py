@@ -27,15 +27,38 @@ Implementation Notes
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/jins-tkomoda/CircuitPython_MPU6886.git"
 
-from math import radians
+from array import array
+from math import pi
+from struct import unpack_from
 from time import sleep
 
 from adafruit_bus_device import i2c_device
 from adafruit_register.i2c_bit import RWBit
 from adafruit_register.i2c_bits import RWBits
-from adafruit_register.i2c_struct import ROUnaryStruct, Struct, UnaryStruct
+from adafruit_register.i2c_struct import ROUnaryStruct, UnaryStruct
 from micropython import const
 
+# sample timestamps are kept in integer nanoseconds where the board supports them. Builds
+# without long integers lack time.monotonic_ns and have too coarse a float time.monotonic,
+# so they use the wrapping millisecond counter from supervisor.ticks_ms instead
+try:
+    from time import monotonic_ns as _ticks
+
+    _TICKS_PER_SECOND = 1_000_000_000
+
+    def _ticks_diff(end: int, start: int) -> int:
+        return end - start
+
+except ImportError:
+    from supervisor import ticks_ms as _ticks
+
+    _TICKS_PER_SECOND = 1000
+    _TICKS_MASK = 0x1FFFFFFF  # supervisor.ticks_ms wraps every 2**29 ms
+
+    def _ticks_diff(end: int, start: int) -> int:
+        return (end - start) & _TICKS_MASK
+
+
 try:
     from typing import Tuple
 
@@ -54,18 +77,34 @@ _MPU6886_SMPLRT_DIV = const(0x19)  # sample rate divisor register
 _MPU6886_CONFIG = const(0x1A)  # General configuration register @OK
 _MPU6886_GYRO_CONFIG = const(0x1B)  # Gyro specfic configuration register @OK
 _MPU6886_ACCEL_CONFIG = const(0x1C)  # Accelerometer specific configration register @OK
+_MPU6886_RANGE_SHIFT = const(3)  # GYRO_FS_SEL / ACCEL_FS_SEL position in their registers
+_MPU6886_RANGE_MASK = const(0x18)  # GYRO_FS_SEL / ACCEL_FS_SEL bits 4:3
+_MPU6886_FIFO_EN = const(0x23)  # FIFO source enable register
 _MPU6886_INT_PIN_CONFIG = const(0x37)  # Interrupt pin configuration register
 _MPU6886_ACCEL_OUT = const(0x3B)  # base address for sensor data reads
-_MPU6886_TEMP_OUT = const(0x41)  # Temperature data high byte register
-_MPU6886_GYRO_OUT = const(0x43)  # base address for sensor data reads
 _MPU6886_SIG_PATH_RESET = const(0x68)  # register to reset sensor signal paths
 _MPU6886_USER_CTRL = const(0x6A)  # FIFO and I2C Master control register
 _MPU6886_PWR_MGMT_1 = const(0x6B)  # Primary power/sleep control register @OK
 _MPU6886_PWR_MGMT_2 = const(0x6C)  # Secondary power/sleep control register
+_MPU6886_FIFO_COUNT = const(0x72)  # FIFO byte count high byte register
+_MPU6886_FIFO_R_W = const(0x74)  # FIFO data read/write register
 _MPU6886_WHO_AM_I = const(0x75)  # Divice ID register
 
 STANDARD_GRAVITY = 9.80665
 
+# accel X, Y, Z, temperature, gyro X, Y, Z as read from ACCEL_OUT onwards
+_SAMPLE_FORMAT = ">hhhhhhh"
+
+# m/s^2 per LSB, indexed by Range
+_ACCEL_SCALE = (
+    STANDARD_GRAVITY / 16384,
+    STANDARD_GRAVITY / 8192,
+    STANDARD_GRAVITY / 4096,
+    STANDARD_GRAVITY / 2048,
+)
+# rad/s per LSB, indexed by GyroRange
+_GYRO_SCALE_RAD = tuple((pi / 180.0) / lsb for lsb in (131.0, 65.5, 32.8, 16.4))
+
 
 class ClockSource:  # pylint: disable=too-few-public-methods
     """Allowed values for :py:attr:`clock_source`.
@@ -138,11 +177,72 @@ class Rate:  # pylint: disable=too-few-public-methods
     CYCLE_40_HZ = const(3)  # 40 Hz
 
 
+class SampleRing:
+    """Fixed-size ring buffer of raw sensor samples, filled by :meth:`MPU6886.stream_into`.
+
+    Samples are stored as signed 16-bit integers in a single preallocated `array.array`,
+    one contiguous block of ``size`` values per channel, so the storage does not grow as
+    samples are pushed. Channels are, in order: accel X, Y, Z, temperature, gyro X, Y, Z.
+    When the ring is full the oldest sample is overwritten.
+
+    :param int size: The number of samples the ring holds
+    """
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size = size
+        self.data = array("h", [0] * (7 * size))
+        self.head = 0
+        self.tail = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def push_sample(
+        self, buf: bytearray, _unpack_from=unpack_from, _sample_format=_SAMPLE_FORMAT
+    ) -> None:
+        """Store the 14-byte big-endian sample in ``buf`` at the head of the ring"""
+        data = self.data
+        size = self.size
+        head = self.head
+        for channel, value in enumerate(_unpack_from(_sample_format, buf)):
+            data[channel * size + head] = value
+        self.head = (head + 1) % size
+        if self._count == size:
+            self.tail = self.head
+        else:
+            self._count += 1
+
+    def pop_sample(self) -> Tuple[int, int, int, int, int, int, int]:
+        """Remove and return the oldest sample as
+        (accel_x, accel_y, accel_z, temp, gyro_x, gyro_y, gyro_z)"""
+        if not self._count:
+            raise IndexError("pop from an empty SampleRing")
+        data = self.data
+        size = self.size
+        tail = self.tail
+        self.tail = (tail + 1) % size
+        self._count -= 1
+        return tuple(data[channel * size + tail] for channel in range(7))
+
+    def channel(self, index: int) -> memoryview:
+        """The storage for one channel, in ring order rather than chronological order"""
+        return memoryview(self.data)[index * self.size : (index + 1) * self.size]
+
+
 class MPU6886:
     """Driver for the MPU6886 6-DoF accelerometer and gyroscope.
 
-    :param ~busio.I2C i2c_bus: The I2C bus the device is connected to
+    :param ~busio.I2C i2c_bus: The I2C bus the device is connected to. The MPU6886 supports
+        400 kHz fast-mode, which cuts the time of each burst read to about a quarter of the
+        100 kHz default
     :param int address: The I2C device address. Defaults to :const:`0x68`
+    :param float max_age: How long, in seconds, a burst-read sample is reused by
+        :attr:`acceleration`, :attr:`gyro` and :attr:`temperature` before the
+        sensor is read again. Set to :const:`0` (or less) to read the sensor on every
+        access. Defaults to :const:`0.002`
 
     **Quickstart: Importing and using the device**
 
@@ -169,52 +269,89 @@ class MPU6886:
             acc_x, acc_y, acc_z = sensor.acceleration
             gyro_x, gyro_y, gyro_z = sensor.gyro
             temperature = sensor.temperature
+
+        or read them all at once with :meth:`sample_all`
+
+        .. code-block:: python
+
+            acc_x, acc_y, acc_z, gyro_x, gyro_y, gyro_z, temperature = sensor.sample_all()
+
+        When logging or processing data on the device, :attr:`raw_acceleration`,
+        :attr:`raw_gyro` and :class:`SampleRing` keep samples as 16-bit integers and skip
+        the float conversion.
+
+        Sensor data is read with a repeated-start ``write_then_readinto``, so no delays are
+        needed between reads. Pace a sampling loop against `time.monotonic` rather than
+        sleeping a fixed amount after each sample.
     """
 
-    def __init__(self, i2c_bus: I2C, address: int = _MPU6886_DEFAULT_ADDRESS) -> None:
+    def __init__(
+        self, i2c_bus: I2C, address: int = _MPU6886_DEFAULT_ADDRESS, max_age: float = 0.002
+    ) -> None:
         self.i2c_device = i2c_device.I2CDevice(i2c_bus, address)
+        self.max_age = max_age
+        # preallocated so that sampling does not allocate new buffers
+        self._raw_buf = bytearray(14)
+        self._raw_mv = memoryview(self._raw_buf)
+        self._reg_addr = bytes([_MPU6886_ACCEL_OUT])
+        self._fifo_addr = bytes([_MPU6886_FIFO_R_W])
+        self._u8_buf = bytearray(2)  # register address, value
+        self._fifo_packet_size = 0
+        self._sample_cache = None
+        self._sample_time = 0
 
         if self._device_id != _MPU6886_DEVICE_ID:
             raise RuntimeError("Failed to find MPU6886 - check your wiring!")
 
+        # reset() polls DEVICE_RESET, which the datasheet's PWR_MGMT_1 register description
+        # says clears automatically once the reset is done, so no fixed wait follows it
         self.reset()
 
         self._sample_rate_divisor = 0
-        self._gyro_range = GyroRange.RANGE_500_DPS
-        self._accel_range = Range.RANGE_2_G
-        sleep(0.100)
+        self._set_gyro_range(GyroRange.RANGE_500_DPS)
+        self._set_accel_range(Range.RANGE_2_G)
         self.clock_source = ClockSource.CLKSEL_INTERNAL_X  # set to use gyro x-axis as reference
-        sleep(0.100)
         self.sleep = False
-        sleep(0.010)
-
-    @classmethod
-    def reset(cls) -> None:
-        """Reinitialize the sensor"""
-        # Touble...
-        # self._reset = True
-        # while self._reset is True:
-        # sleep(0.1)
-
-        sleep(0.1)
-
-        _signal_path_reset = 0b111  # reset all sensors
-        sleep(0.1)
+        # Gyroscope start-up time from sleep mode (datasheet section 3.1, Gyroscope
+        # Specifications: 35 ms). The PLL runs off the gyro X drive, so it is usable then
+        sleep(0.035)
+
+    def reset(self) -> None:
+        """Reset the sensor to its power-on defaults: asleep, with the automatically selected
+        clock source, the FIFO disabled and the default full-scale ranges. The sensor must be
+        reconfigured and woken up by setting :attr:`sleep` to `False` afterwards."""
+        self._reset = True
+        start = _ticks()
+        while True:
+            try:
+                if not self._reset:
+                    break
+            except OSError:
+                pass  # the device may not acknowledge while it is resetting
+            if _ticks_diff(_ticks(), start) > 0.1 * _TICKS_PER_SECOND:
+                raise RuntimeError("Timed out waiting for the MPU6886 to reset")
+            sleep(0.001)
+
+        # DEVICE_RESET also resets the signal paths, so SIGNAL_PATH_RESET is not needed
+        self._fifo_packet_size = 0
+        self._cached_gyro_range = GyroRange.RANGE_250_DPS
+        self._cached_gyro_scale = _GYRO_SCALE_RAD[GyroRange.RANGE_250_DPS]
+        self._cached_accel_range = Range.RANGE_2_G
+        self._cached_accel_scale = _ACCEL_SCALE[Range.RANGE_2_G]
+        self._sample_cache = None
 
     _clksel = RWBits(3, _MPU6886_PWR_MGMT_1, 0)
     _device_id = ROUnaryStruct(_MPU6886_WHO_AM_I, ">B")
 
     _reset = RWBit(_MPU6886_PWR_MGMT_1, 7, 1)
-    _signal_path_reset = RWBits(3, _MPU6886_SIG_PATH_RESET, 3)
-
-    _gyro_range = RWBits(2, _MPU6886_GYRO_CONFIG, 3)
-    _accel_range = RWBits(2, _MPU6886_ACCEL_CONFIG, 3)
 
     _filter_bandwidth = RWBits(2, _MPU6886_CONFIG, 3)
 
-    _raw_accel_data = Struct(_MPU6886_ACCEL_OUT, ">hhh")
-    _raw_gyro_data = Struct(_MPU6886_GYRO_OUT, ">hhh")
-    _raw_temp_data = ROUnaryStruct(_MPU6886_TEMP_OUT, ">h")
+    # bit 4: gyro, bit 3: accel; either one also writes TEMP_OUT (datasheet register 35, FIFO_EN)
+    _fifo_sources = RWBits(2, _MPU6886_FIFO_EN, 3)
+    _fifo_enable = RWBit(_MPU6886_USER_CTRL, 6)
+    _fifo_reset = RWBit(_MPU6886_USER_CTRL, 2)
+    _fifo_count = ROUnaryStruct(_MPU6886_FIFO_COUNT, ">H")
 
     _cycle = RWBit(_MPU6886_PWR_MGMT_1, 5)
     _cycle_rate = RWBits(2, _MPU6886_PWR_MGMT_2, 6, 1)
@@ -225,64 +362,187 @@ class MPU6886:
     sample_rate_divisor = UnaryStruct(_MPU6886_SMPLRT_DIV, ">B")
     """The sample rate divisor. See the datasheet for additional detail"""
 
+    def _read_u8(self, register: int) -> int:
+        buf = self._u8_buf
+        buf[0] = register
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(buf, buf, out_end=1, in_start=1)
+        return buf[1]
+
+    def _write_u8(self, register: int, value: int) -> None:
+        buf = self._u8_buf
+        buf[0] = register
+        buf[1] = value
+        with self.i2c_device as i2c:
+            i2c.write(buf)
+
+    def _write_range(self, register: int, value: int) -> None:
+        config = self._read_u8(register) & ~_MPU6886_RANGE_MASK
+        self._write_u8(register, config | (value << _MPU6886_RANGE_SHIFT))
+
+    def _set_gyro_range(self, value: int) -> None:
+        self._write_range(_MPU6886_GYRO_CONFIG, value)
+        self._cached_gyro_range = value
+        self._cached_gyro_scale = _GYRO_SCALE_RAD[value]
+        self._sample_cache = None  # read under the old range
+
+    def _set_accel_range(self, value: int) -> None:
+        self._write_range(_MPU6886_ACCEL_CONFIG, value)
+        self._cached_accel_range = value
+        self._cached_accel_scale = _ACCEL_SCALE[value]
+        self._sample_cache = None  # read under the old range
+
+    # module-level names used on the sample path are bound as default arguments, which
+    # MicroPython loads as fast locals instead of global dictionary lookups
+    def _sample(
+        self, _unpack_from=unpack_from, _sample_format=_SAMPLE_FORMAT
+    ) -> Tuple[int, int, int, int, int, int, int]:
+        """Burst read ACCEL_OUT, TEMP_OUT and GYRO_OUT, which are contiguous, and return
+        (accel_x, accel_y, accel_z, temp, gyro_x, gyro_y, gyro_z)"""
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._reg_addr, self._raw_buf)
+        return _unpack_from(_sample_format, self._raw_mv)
+
+    def _read_all(
+        self, _ticks=_ticks, _ticks_diff=_ticks_diff
+    ) -> Tuple[int, int, int, int, int, int, int]:
+        """Return the raw sensor data, reusing the last burst read if it is
+        younger than :attr:`max_age`"""
+        now = _ticks()
+        if (
+            self._sample_cache is None
+            or _ticks_diff(now, self._sample_time) >= self.max_age * _TICKS_PER_SECOND
+        ):
+            self._sample_cache = self._sample()
+            self._sample_time = now
+        return self._sample_cache
+
     @property
     def temperature(self) -> float:
         """The current temperature in  º Celsius"""
-        raw_temperature = self._raw_temp_data
+        raw_temperature = self._read_all()[3]
         temp = (raw_temperature / 340.0) + 36.53
         return temp
 
     @property
     def acceleration(self) -> Tuple[float, float, float]:
         """Acceleration X, Y, and Z axis data in :math:`m/s^2`"""
-        raw_data = self._raw_accel_data
-        raw_x = raw_data[0]
-        raw_y = raw_data[1]
-        raw_z = raw_data[2]
-
-        accel_range = self._accel_range
-        accel_scale = 1
-        if accel_range == Range.RANGE_16_G:
-            accel_scale = 2048
-        if accel_range == Range.RANGE_8_G:
-            accel_scale = 4096
-        if accel_range == Range.RANGE_4_G:
-            accel_scale = 8192
-        if accel_range == Range.RANGE_2_G:
-            accel_scale = 16384
-
-        # setup range dependant scaling
-        accel_x = (raw_x / accel_scale) * STANDARD_GRAVITY
-        accel_y = (raw_y / accel_scale) * STANDARD_GRAVITY
-        accel_z = (raw_z / accel_scale) * STANDARD_GRAVITY
-
-        return (accel_x, accel_y, accel_z)
+        raw_data = self._read_all()
+        scale = self._cached_accel_scale
+        return (raw_data[0] * scale, raw_data[1] * scale, raw_data[2] * scale)
 
     @property
     def gyro(self) -> Tuple[float, float, float]:
         """Gyroscope X, Y, and Z axis data in :math:`rad/s`"""
-        raw_data = self._raw_gyro_data
-        raw_x = raw_data[0]
-        raw_y = raw_data[1]
-        raw_z = raw_data[2]
-
-        gyro_scale = 1
-        gyro_range = self._gyro_range
-        if gyro_range == GyroRange.RANGE_250_DPS:
-            gyro_scale = 131
-        if gyro_range == GyroRange.RANGE_500_DPS:
-            gyro_scale = 65.5
-        if gyro_range == GyroRange.RANGE_1000_DPS:
-            gyro_scale = 32.8
-        if gyro_range == GyroRange.RANGE_2000_DPS:
-            gyro_scale = 16.4
-
-        # setup range dependant scaling
-        gyro_x = radians(raw_x / gyro_scale)
-        gyro_y = radians(raw_y / gyro_scale)
-        gyro_z = radians(raw_z / gyro_scale)
-
-        return (gyro_x, gyro_y, gyro_z)
+        raw_data = self._read_all()
+        scale = self._cached_gyro_scale
+        return (raw_data[4] * scale, raw_data[5] * scale, raw_data[6] * scale)
+
+    @property
+    def raw_acceleration(self) -> Tuple[int, int, int]:
+        """Unscaled accelerometer X, Y, and Z axis data as signed 16-bit integers.
+        Divide by the LSB sensitivity of :attr:`accelerometer_range` to get :math:`g`"""
+        raw_data = self._read_all()
+        return (raw_data[0], raw_data[1], raw_data[2])
+
+    @property
+    def raw_gyro(self) -> Tuple[int, int, int]:
+        """Unscaled gyroscope X, Y, and Z axis data as signed 16-bit integers.
+        Divide by the LSB sensitivity of :attr:`gyro_range` to get :math:`deg/s`"""
+        raw_data = self._read_all()
+        return (raw_data[4], raw_data[5], raw_data[6])
+
+    def sample_all(self, _ticks=_ticks) -> Tuple[float, float, float, float, float, float, float]:
+        """Read acceleration, gyroscope and temperature data in a single burst read.
+
+        :return: (accel_x, accel_y, accel_z, gyro_x, gyro_y, gyro_z, temperature) in
+            :math:`m/s^2`, :math:`rad/s` and º Celsius
+        """
+        raw_ax, raw_ay, raw_az, raw_t, raw_gx, raw_gy, raw_gz = raw_data = self._sample()
+        self._sample_cache = raw_data
+        self._sample_time = _ticks()
+        accel_scale = self._cached_accel_scale
+        gyro_scale = self._cached_gyro_scale
+        return (
+            raw_ax * accel_scale,
+            raw_ay * accel_scale,
+            raw_az * accel_scale,
+            raw_gx * gyro_scale,
+            raw_gy * gyro_scale,
+            raw_gz * gyro_scale,
+            (raw_t / 340.0) + 36.53,
+        )
+
+    def sample_into(self, buf: bytearray, offset: int = 0) -> None:
+        """Burst read one raw sample straight into caller-owned storage.
+
+        Writes 14 bytes to ``buf[offset:offset + 14]``, laid out as big-endian signed 16-bit
+        accel X, Y, Z, temperature, gyro X, Y, Z.
+
+        :param bytearray buf: The buffer to read into
+        :param int offset: Where in ``buf`` to place the sample
+        """
+        if offset < 0 or len(buf) < offset + 14:
+            raise ValueError("buf must have room for 14 bytes at offset")
+        with self.i2c_device as i2c:
+            i2c.write_then_readinto(self._reg_addr, buf, in_start=offset, in_end=offset + 14)
+
+    def stream_into(self, ring: SampleRing, count: int) -> None:
+        """Take ``count`` back-to-back burst reads and push them into ``ring``.
+
+        :param SampleRing ring: The ring buffer to store the raw samples in
+        :param int count: The number of samples to read
+        """
+        buf = self._raw_buf
+        reg_addr = self._reg_addr
+        with self.i2c_device as i2c:
+            for _ in range(count):
+                i2c.write_then_readinto(reg_addr, buf)
+                ring.push_sample(buf)
+
+    def enable_fifo(self, accel: bool = True, gyro: bool = True) -> None:
+        """Reset the FIFO and start buffering samples into it at the sample rate.
+
+        Each FIFO packet holds big-endian signed 16-bit values in register order. Per the
+        datasheet's description of register 35 (FIFO_EN), both ACCEL_FIFO_EN and GYRO_FIFO_EN
+        also write TEMP_OUT, so packets are laid out as:
+
+        * accel only: accel X, Y, Z, temperature (8 bytes)
+        * gyro only: temperature, gyro X, Y, Z (8 bytes)
+        * both: accel X, Y, Z, temperature, gyro X, Y, Z (14 bytes)
+
+        Disables the FIFO if neither is set. Use :meth:`read_fifo` to drain it.
+
+        :param bool accel: Write accelerometer and temperature data to the FIFO
+        :param bool gyro: Write gyroscope and temperature data to the FIFO
+        """
+        self._fifo_enable = False
+        self._fifo_sources = (gyro << 1) | accel
+        self._fifo_packet_size = 6 * accel + 6 * gyro + 2 * (accel or gyro)
+        self._fifo_reset = True
+        if accel or gyro:
+            self._fifo_enable = True
+
+    @property
+    def fifo_count(self) -> int:
+        """The number of bytes currently held in the FIFO"""
+        return self._fifo_count & 0x1FFF
+
+    def read_fifo(self, buf: bytearray) -> int:
+        """Read as many complete FIFO packets as are available and fit in ``buf`` with a
+        single I2C transaction. See :meth:`enable_fifo` for the packet layout.
+
+        :param bytearray buf: Caller-owned buffer the packets are read into
+        :return: The number of packets read
+        """
+        packet_size = self._fifo_packet_size
+        if not packet_size:
+            raise RuntimeError("The FIFO must be enabled with enable_fifo() first")
+        count = min(self.fifo_count, len(buf)) // packet_size
+        if count:
+            with self.i2c_device as i2c:
+                i2c.write_then_readinto(self._fifo_addr, buf, in_end=count * packet_size)
+        return count
 
     @property
     def cycle(self) -> bool:
@@ -298,25 +558,25 @@ class MPU6886:
     @property
     def gyro_range(self) -> int:
         """The measurement range of all gyroscope axes. Must be a `GyroRange`"""
-        return self._gyro_range
+        return self._cached_gyro_range
 
     @gyro_range.setter
     def gyro_range(self, value: int) -> None:
-        if (value < 0) or (value > 3):
+        if value not in range(4):
             raise ValueError("gyro_range must be a GyroRange")
-        self._gyro_range = value
+        self._set_gyro_range(value)
         sleep(0.01)
 
     @property
     def accelerometer_range(self) -> int:
         """The measurement range of all accelerometer axes. Must be a `Range`"""
-        return self._accel_range
+        return self._cached_accel_range
 
     @accelerometer_range.setter
     def accelerometer_range(self, value: int) -> None:
-        if (value < 0) or (value > 3):
+        if value not in range(4):
             raise ValueError("accelerometer_range must be a Range")
-        self._accel_range = value
+        self._set_accel_range(value)
         sleep(0.01)
 
     @property